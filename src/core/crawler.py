@@ -1,12 +1,62 @@
+import asyncio
 import logging
+import re
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Set
-from urllib.parse import urljoin, urlparse
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+from urllib.parse import SplitResult, urljoin, urlsplit, urlunsplit
 
 from .scraper import Scraper
 
 logger = logging.getLogger(__name__)
 
+_STATIC_ASSET_RE = re.compile(
+    r"/(?:cdn-cgi|wp-admin|wp-includes|assets|static)/", re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=2048)
+def _cached_urlsplit(url: str) -> SplitResult:
+    """Split a URL, memoizing the result since links repeat heavily during a crawl."""
+    return urlsplit(url)
+
+
+@lru_cache(maxsize=256)
+def _registrable_domain(netloc: str) -> str:
+    """Approximate the registrable domain as the last two netloc labels."""
+    return ".".join(netloc.split(".")[-2:])
+
+
+@lru_cache(maxsize=4096)
+def _normalize_url(url: str) -> str:
+    """Normalize a URL by removing fragments and trailing slashes."""
+    parsed = _cached_urlsplit(url)
+    return urlunsplit(
+        (parsed.scheme, parsed.netloc, parsed.path.rstrip("/"), parsed.query, "")
+    )
+
+
+def _prep_options(options: Dict) -> Dict:
+    """
+    Return a copy of options with path filters split into exact paths and
+    prefixes (patterns ending with ``*``), so each filter is one set lookup
+    plus one ``str.startswith`` call per URL.
+    """
+    prepared = dict(options)
+    for key, name in (
+        ("exclude_paths", "_exclude"),
+        ("include_only_paths", "_include"),
+    ):
+        patterns = options.get(key) or ()
+        prepared[f"{name}_exact"] = frozenset(
+            p for p in patterns if not p.endswith("*")
+        )
+        prepared[f"{name}_prefixes"] = tuple(
+            p[:-1] for p in patterns if p.endswith("*")
+        )
+    return prepared
+
 
 class Crawler:
     """Web crawler with configurable options and job tracking."""
@@ -14,42 +64,48 @@ class Crawler:
     def __init__(self):
         """Initialize the Crawler."""
         self.visited: Set[str] = set()
-        self.queue: Set[str] = set()
+        self.enqueued: Set[str] = set()
+        self._scraper: Optional[Scraper] = None
 
     async def __aenter__(self):
-        """Enter the async context manager."""
+        """Enter the async context manager and open a shared scraper."""
+        self._scraper = await Scraper().__aenter__()
         return self
 
     async def __aexit__(self, exc_type, exc_value, exc_tb):
-        """Exit the async context manager."""
-        pass
+        """Exit the async context manager and close the shared scraper."""
+        if self._scraper is not None:
+            await self._scraper.__aexit__(exc_type, exc_value, exc_tb)
+            self._scraper = None
+
+    @asynccontextmanager
+    async def _scraper_session(self) -> AsyncIterator[Scraper]:
+        """Yield the shared scraper, or a temporary one outside ``async with``."""
+        if self._scraper is not None:
+            yield self._scraper
+        else:
+            async with Scraper() as scraper:
+                yield scraper
 
     def _is_same_domain(
-        self, url1: str, url2: str, include_subdomains: bool = False
+        self, url: str, base_parsed: SplitResult, include_subdomains: bool = False
     ) -> bool:
-        """Check if two URLs belong to the same domain."""
-        print("i'm here 3")
-        parsed1 = urlparse(url1)
-        parsed2 = urlparse(url2)
+        """Check if a URL belongs to the same domain as the pre-split base URL."""
+        netloc = _cached_urlsplit(url).netloc
         if include_subdomains:
-            domain1 = ".".join(parsed1.netloc.split(".")[-2:])
-            domain2 = ".".join(parsed2.netloc.split(".")[-2:])
-            return domain1 == domain2
-
-        return parsed1.netloc == parsed2.netloc
+            return _registrable_domain(netloc) == _registrable_domain(
+                base_parsed.netloc
+            )
 
-    def _normalize_url(self, url: str) -> str:
-        """Normalize a URL by removing fragments and trailing slashes."""
-        parsed = urlparse(url)
-        return f"{parsed.scheme}://{parsed.netloc}{parsed.path.rstrip('/')}{'?' + parsed.query if parsed.query else ''}"
+        return netloc == base_parsed.netloc
 
-    def _should_crawl(self, url: str, base_url: str, options: Dict) -> bool:
+    def _should_crawl(self, url: str, base_parsed: SplitResult, options: Dict) -> bool:
         """
         Check if a URL should be crawled based on options.
 
         Args:
             url: URL to check.
-            base_url: Original starting URL.
+            base_parsed: Original starting URL, already split.
             options: Crawling options including:
                 - max_pages: Maximum number of pages to crawl
                 - exclude_paths: Lis of path patterns to exclude
@@ -57,55 +113,46 @@ class Crawler:
                 - include_backwards: Allow crawling to parent directories
                 - include_subdomains: Allow crawling to subdomains
         """
-        if not url or not url.startswith(("http://", "https://")):
+        if not url:
+            return False
+        return self._should_crawl_normalized(_normalize_url(url), base_parsed, options)
+
+    def _should_crawl_normalized(
+        self, normalized: str, base_parsed: SplitResult, options: Dict
+    ) -> bool:
+        """Check a URL already passed through ``_normalize_url`` against options."""
+        if not normalized.startswith(("http://", "https://")):
             return False
         include_subdomains = options.get("include_subdomains", False)
         if not options.get("allow_backwards", False) and not self._is_same_domain(
-            url, base_url, include_subdomains
+            normalized, base_parsed, include_subdomains
         ):
             return False
 
-        normalized = self._normalize_url(url)
         if normalized in self.visited:
             return False
 
         if options.get("max_pages") and len(self.visited) >= options["max_pages"]:
             return False
 
-        path = urlparse(normalized).path
-
-        if any(
-            p in path.lower()
-            for p in [
-                "/cdn-cgi/",
-                "/wp-admin/",
-                "/wp-includes/",
-                "/assets/",
-                "/static/",
-            ]
+        path = _cached_urlsplit(normalized).path
+
+        if _STATIC_ASSET_RE.search(path):
+            return False
+
+        if "_exclude_exact" not in options:
+            options = _prep_options(options)
+
+        if path in options["_exclude_exact"] or path.startswith(
+            options["_exclude_prefixes"]
         ):
             return False
 
-        if options.get("exclude_paths"):
-            for pattern in options["exclude_paths"]:
-                if pattern.endswith("*"):
-                    if path.startswith(pattern[:-1]):
-                        return False
-                elif path == pattern:
-                    return False
-
-        if options.get("include_only_paths"):
-            matched = False
-            for pattern in options["include_only_paths"]:
-                if pattern.endswith("*"):
-                    if path.startswith(pattern[:-1]):
-                        matched = True
-                        break
-                elif path == pattern:
-                    matched = True
-                    break
-            if not matched:
-                return False
+        if (options["_include_exact"] or options["_include_prefixes"]) and not (
+            path in options["_include_exact"]
+            or path.startswith(options["_include_prefixes"])
+        ):
+            return False
 
         return True
 
@@ -126,12 +173,13 @@ class Crawler:
         """
         options = options or {}
         self.visited.clear()
-        self.queue.clear()
+        self.enqueued.clear()
 
-        async with Scraper() as scraper:
+        async with self._scraper_session() as scraper:
+            # Only links are needed, so skip generating any content formats.
             result = await scraper.scrape(
                 url=url,
-                formats=["markdown"],
+                formats=[],
                 page_options=options.get(
                     "page_options", {"include_links": True, "structured_json": True}
                 ),
@@ -141,10 +189,16 @@ class Crawler:
                 raise Exception(result["error"])
 
             urls = {url}
+            base_parsed = urlsplit(url)
+            filter_options = _prep_options(options)
             if result.get("links"):
-                for link in result["links"]:
-                    normalized = self._normalize_url(urljoin(url, link["url"]))
-                    if self._should_crawl(normalized, url, options):
+                for link_url in dict.fromkeys(link["url"] for link in result["links"]):
+                    normalized = _normalize_url(urljoin(url, link_url))
+                    if normalized in urls:
+                        continue
+                    if self._should_crawl_normalized(
+                        normalized, base_parsed, filter_options
+                    ):
                         urls.add(normalized)
 
             if options.get("search"):
@@ -169,6 +223,7 @@ class Crawler:
                 - exclude_paths: List of path patterns to include
                 - include_only_paths: List of path patterns to include
                 - allow_backwards: Allow crawling to parent directories
+                - concurrency: Number of worker tasks fetching pages
 
         Returns:
             Dictionary containing the crawled pages and metadata.
@@ -185,9 +240,13 @@ class Crawler:
             if not isinstance(max_pages, int) or max_pages < 1:
                 raise ValueError("max_pages must be a positive integer")
 
+        concurrency = options.get("concurrency", 20)
+        if not isinstance(concurrency, int) or concurrency < 1:
+            raise ValueError("concurrency must be a positive integer")
+
         self.visited.clear()
-        self.queue.clear()
-        self.queue.add(url)
+        self.enqueued.clear()
+        self.enqueued.add(_normalize_url(url))
 
         results = {
             "pages": {},
@@ -199,70 +258,88 @@ class Crawler:
             },
         }
 
-        current_depth = 0
+        formats = options.get("formats", ["markdown"])
+        page_options = options.get(
+            "page_options",
+            {
+                "extract_main_content": True,
+                "include_links": True,
+                "structured_json": True,
+            },
+        )
+        base_parsed = urlsplit(url)
+        filter_options = _prep_options(options)
+        depth_reached = -1
 
-        async with Scraper() as scraper:
-            while self.queue and (max_depth is None or current_depth < max_depth):
-                current_urls = self.queue.copy()
-                self.queue.clear()
+        queue: asyncio.Queue = asyncio.Queue()
+        if max_depth > 0:
+            queue.put_nowait((url, 0))
 
-                for current_url in current_urls:
-                    print(f"Current URL: {current_url}")
-                    print(
-                        f"shoudl crawl: {self._should_crawl(current_url, url, options)}"
-                    )
-                    if not self._should_crawl(current_url, url, options):
-                        continue
+        async with self._scraper_session() as scraper:
 
-                    normalized = self._normalize_url(current_url)
-                    print(f"Visiting {normalized}")
+            async def _visit(current_url: str, depth: int):
+                nonlocal depth_reached
+                if not self._should_crawl(current_url, base_parsed, filter_options):
+                    return
 
-                    self.visited.add(normalized)
+                normalized = _normalize_url(current_url)
+                logger.debug(f"Visiting {normalized}")
 
-                    try:
-                        result = await scraper.scrape(
-                            normalized,
-                            formats=options.get("formats", ["markdown"]),
-                            page_options=options.get(
-                                "page_options",
-                                {
-                                    "extract_main_content": True,
-                                    "include_links": True,
-                                    "structured_json": True,
-                                },
-                            ),
-                        )
-
-                        print(f"Scraped {normalized}: {result}")
-
-                        if result and not result.get("error"):
-                            results["pages"][normalized] = {
-                                "content": result.get("content", {}),
-                                "metadata": result.get("metadata", {}),
-                                "links": result.get("links", []),
-                            }
-
-                            if result.get("links"):
-                                for link in result["links"]:
-                                    normalized_link = self._normalize_url(
-                                        urljoin(current_url, link["url"])
-                                    )
-                                    if self._should_crawl(
-                                        normalized_link, url, options
-                                    ):
-                                        self.queue.add(normalized_link)
-                    except Exception as e:
-                        logger.error(f"Error scrapping {normalized}: {str(e)}")
+                self.visited.add(normalized)
+                depth_reached = max(depth_reached, depth)
+
+                try:
+                    result = await scraper.scrape(
+                        normalized, formats=formats, page_options=page_options
+                    )
+
+                    if result and not result.get("error"):
                         results["pages"][normalized] = {
-                            "error": str(e),
-                            "content": {},
-                            "metadata": {},
+                            "content": result.get("content", {}),
+                            "metadata": result.get("metadata", {}),
+                            "links": result.get("links", []),
                         }
-                    results["metadata"]["total_pages"] += 1
 
-                current_depth += 1
+                        if depth + 1 < max_depth and result.get("links"):
+                            for link in result["links"]:
+                                normalized_link = _normalize_url(
+                                    urljoin(current_url, link["url"])
+                                )
+                                if normalized_link in self.enqueued:
+                                    continue
+                                if self._should_crawl_normalized(
+                                    normalized_link, base_parsed, filter_options
+                                ):
+                                    self.enqueued.add(normalized_link)
+                                    queue.put_nowait((normalized_link, depth + 1))
+                except Exception as e:
+                    logger.error(f"Error scrapping {normalized}: {str(e)}")
+                    results["pages"][normalized] = {
+                        "error": str(e),
+                        "content": {},
+                        "metadata": {},
+                    }
+                results["metadata"]["total_pages"] += 1
+
+            async def _worker():
+                while True:
+                    current_url, depth = await queue.get()
+                    try:
+                        await _visit(current_url, depth)
+                    except Exception as e:
+                        logger.error(f"Error crawling {current_url}: {str(e)}")
+                    finally:
+                        queue.task_done()
+
+            workers = [asyncio.create_task(_worker()) for _ in range(concurrency)]
+            try:
+                await queue.join()
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
 
         results["metadata"]["end_time"] = datetime.now().isoformat()
-        results["metadata"]["depth_reached"] = current_depth - 1
+        results["metadata"]["depth_reached"] = depth_reached
 
         return results
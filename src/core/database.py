@@ -1,22 +1,64 @@
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
+import orjson
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import JSON, Column, DateTime, String, create_engine
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    LargeBinary,
+    String,
+    create_engine,
+    event,
+)
 from sqlalchemy.orm import (
+    Session,
     declarative_base,
     sessionmaker,
 )  # Updated import for SQLAlchemy 2.0 compatibility
+from sqlalchemy.types import TypeDecorator
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 
 engine = create_engine(SQLALCHEMY_DATABASE_URL)
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL journaling with relaxed syncing to cut fsyncs per commit."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()  # This line is fine now with the updated import
 
 
+class OJSON(TypeDecorator):
+    """JSON column stored as orjson-encoded bytes."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else orjson.dumps(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else orjson.loads(value)
+
+
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # History listings filter on status and sort newest first.
+        Index("ix_job_status_created", "status", "created_at"),
+        Index("ix_job_created", "created_at"),
+    )
 
     id = Column(String, primary_key=True)
     url = Column(String)
@@ -24,10 +66,10 @@ class Job(Base):
     status = Column(String)
     created_at = Column(DateTime, default=datetime.now)
     completed_at = Column(DateTime, nullable=True)
-    error = Column(JSON, nullable=True)
-    result = Column(JSON, nullable=True)
-    formats = Column(JSON, nullable=True)
-    page_options = Column(JSON, nullable=True)
+    error = Column(OJSON, nullable=True)
+    result = Column(OJSON, nullable=True)
+    formats = Column(OJSON, nullable=True)
+    page_options = Column(OJSON, nullable=True)
 
 
 class ScrapedContent(Base):
@@ -35,8 +77,8 @@ class ScrapedContent(Base):
 
     job_id = Column(String, primary_key=True)
     url = Column(String)
-    content = Column(JSON)
-    metadata_content = Column(JSON)
+    content = Column(OJSON)
+    metadata_content = Column(OJSON)
     created_at = Column(DateTime, default=datetime.now)
 
 
@@ -80,7 +122,9 @@ class ScrapedContentResponse(ScrapedContentBase):
     created_at: datetime
 
 
-def get_db():
+@contextmanager
+def get_db_session() -> Iterator[Session]:
+    """Open a session for use outside request handlers and always close it."""
     db = SessionLocal()
     try:
         yield db
@@ -88,4 +132,9 @@ def get_db():
         db.close()
 
 
+def get_db():
+    with get_db_session() as db:
+        yield db
+
+
 Base.metadata.create_all(bind=engine)
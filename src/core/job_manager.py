@@ -1,7 +1,8 @@
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
+import orjson
 from sqlalchemy.orm import Session
 
 from .database import Job, ScrapedContent
@@ -11,18 +12,20 @@ class JobManager:
     def __init__(self):
         pass
 
+    @staticmethod
+    def _json_default(data: Any) -> Any:
+        """Fallback for values orjson cannot serialize natively."""
+        if hasattr(data, "dict"):
+            return data.dict(exclude_unset=True)
+        return str(data)
+
     def _serialize_dict(self, data: Any) -> Any:
         """Convert any data structure to JSON-serializable format."""
-        if hasattr(data, "dict"):
-            return self._serialize_dict(data.dict(exclude_unset=True))
-        elif isinstance(data, dict):
-            return {key: self._serialize_dict(value) for key, value in data.items()}
-        elif isinstance(data, (list, tuple)):
-            return [self._serialize_dict(item) for item in data]
-        elif isinstance(data, (str, int, float, bool, type(None))):
-            return data
-        else:
-            return str(data)
+        return orjson.loads(
+            orjson.dumps(
+                data, default=self._json_default, option=orjson.OPT_NON_STR_KEYS
+            )
+        )
 
     def create_job(
         self,
@@ -32,25 +35,38 @@ class JobManager:
         formats: list = None,
         page_options: dict = None,
     ) -> str:
-        job_id = str(uuid4())
+        return self.create_jobs(db, [url], operation, formats, page_options)[0]
 
+    def create_jobs(
+        self,
+        db: Session,
+        urls: List[str],
+        operation: str = "scrape",
+        formats: list = None,
+        page_options: dict = None,
+    ) -> List[str]:
+        """Create one pending job per URL, sharing a timestamp and a single commit."""
         if formats is not None:
             formats = self._serialize_dict(formats)
         if page_options is not None:
             page_options = self._serialize_dict(page_options)
 
-        job = Job(
-            id=job_id,
-            url=url,
-            operation=operation,
-            status="pending",
-            created_at=datetime.now(),
-            formats=formats,
-            page_options=page_options,
-        )
-        db.add(job)
+        now = datetime.now()
+        jobs = [
+            Job(
+                id=str(uuid4()),
+                url=url,
+                operation=operation,
+                status="pending",
+                created_at=now,
+                formats=formats,
+                page_options=page_options,
+            )
+            for url in urls
+        ]
+        db.add_all(jobs)
         db.commit()
-        return job_id
+        return [job.id for job in jobs]
 
     def update_job(
         self,
@@ -59,15 +75,26 @@ class JobManager:
         status: str,
         result: Optional[Any] = None,
         error: Optional[str] = None,
+        commit: bool = True,
     ):
+        """
+        Update a job's status and store its result.
+
+        With ``commit=False`` the changes are only flushed to the session so
+        that many updates can be committed together with ``commit_pending``.
+        Such a batch is all-or-nothing: the caller owns the transaction, and a
+        failed update is not rolled back here, so earlier queued updates stay
+        pending until the caller commits or rolls back.
+        """
         try:
-            job = db.query(Job).filter(Job.id == job_id).first()
+            job = db.get(Job, job_id)
             if not job:
                 return
 
+            now = datetime.now()
             job.status = status
             if status in ["completed", "failed"]:
-                job.completed_at = datetime.now()
+                job.completed_at = now
 
             if error:
                 job.error = error
@@ -77,11 +104,7 @@ class JobManager:
                 if isinstance(result, dict):
                     result = self._serialize_dict(result)
 
-                existing_content = (
-                    db.query(ScrapedContent)
-                    .filter(ScrapedContent.job_id == job_id)
-                    .first()
-                )
+                existing_content = db.get(ScrapedContent, job_id)
                 if existing_content:
                     db.delete(existing_content)
 
@@ -92,14 +115,26 @@ class JobManager:
                     content=result.get("content", {}),
                 )
                 db.add(scraped_content)
-            db.commit()
+            if commit:
+                db.commit()
+            else:
+                db.flush()
         except Exception as e:
-            db.rollback()
+            if commit:
+                db.rollback()
             print(f"Error updating job {job_id}: {str(e)}")
             raise
 
+    def commit_pending(self, db: Session):
+        """Commit all updates queued with ``update_job(..., commit=False)``."""
+        try:
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
     def get_job_status(self, db: Session, job_id: str) -> Optional[Dict[str, Any]]:
-        job = db.query(Job).filter(Job.id == job_id).first()
+        job = db.get(Job, job_id)
         if not job:
             return None
 
@@ -114,9 +149,7 @@ class JobManager:
         }
 
         if job.status == "completed":
-            content = (
-                db.query(ScrapedContent).filter(ScrapedContent.job_id == job_id).first()
-            )
+            content = db.get(ScrapedContent, job_id)
             if content:
                 result["result"] = {
                     "metadata_content": content.metadata_content,
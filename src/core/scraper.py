@@ -1,19 +1,122 @@
 import asyncio
-import json
 import logging
 import re
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from urllib.parse import urljoin
 
 import aiohttp
 import markdownify
-from bs4 import BeautifulSoup
+import orjson
+import soupsieve
+from bs4 import BeautifulSoup, Tag
 from fake_useragent import UserAgent
-from playwright.async_api import async_playwright
+from playwright.async_api import Browser, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 logger = logging.getLogger(__name__)
 
+_RE_HEADER = re.compile(r"^(#+)\s*(.+?)[\s#]*$", re.MULTILINE)
+_RE_QUOTE = re.compile(r'^"(.+?)"$', re.MULTILINE)
+_RE_BYLINE = re.compile(r"^by\s+(.+?)\s*$", re.MULTILINE)
+_RE_LIST_ITEM = re.compile(r"^\s*[-*+]\s*(.+)$", re.MULTILINE)
+_RE_LINK = re.compile(r"\[(.*?)\]\(([^)]+)\)")
+_RE_BLANK_LINES = re.compile(r"\n{3,}")
+
+# Shared converter so markdown is produced straight from the parsed tree.
+_MARKDOWN_CONVERTER = markdownify.MarkdownConverter(
+    heading_style="ATX",
+    bullets=["•", "◦", "▪"],
+    default_title=False,
+)
+
+# Loading the user agent dataset is slow, so do it once per process.
+_UA = UserAgent()
+
+# Most pages carry one or two JSON-LD blocks; don't parse more than this.
+_MAX_LD_JSON_SCRIPTS = 5
+
+# With limit_per_host, requests may queue for a pooled connection when many
+# jobs target the same host, so the total budget is generous and only backstops
+# DNS, pool waits and slow headers. The body read gets its own deadline below.
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=300, sock_connect=10, sock_read=30)
+
+# Seconds allowed for reading a response body once its headers have arrived.
+# sock_read restarts on every chunk, so a trickling server needs a hard limit.
+_BODY_READ_DEADLINE = 60
+
+# Default timeout, in milliseconds, for wait_for_selector/wait_for_load_state.
+DEFAULT_BROWSER_WAIT_TIMEOUT = 30000
+_LOAD_STATES = ("load", "domcontentloaded", "networkidle")
+
+# Upper bound on the response body read by _fetch_url, in bytes.
+DEFAULT_MAX_BODY_BYTES = 10 * 1024 * 1024
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+@lru_cache(maxsize=64)
+def _compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector once; batches reuse the same main-content selector."""
+    return soupsieve.compile(selector)
+
+
+_SHARED_SESSION: Optional[aiohttp.ClientSession] = None
+_SHARED_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _new_session() -> aiohttp.ClientSession:
+    """Create an aiohttp session with the scraper's connection limits."""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=100, limit_per_host=4, use_dns_cache=True, ttl_dns_cache=300
+        )
+    )
+
+
+def _installed_session() -> Optional[aiohttp.ClientSession]:
+    """Return the shared session if one is open for the running event loop."""
+    if (
+        _SHARED_SESSION is not None
+        and not _SHARED_SESSION.closed
+        and _SHARED_SESSION_LOOP is asyncio.get_running_loop()
+    ):
+        return _SHARED_SESSION
+    return None
+
+
+async def open_shared_session() -> aiohttp.ClientSession:
+    """Install a session shared by every Scraper on the running event loop.
+
+    The owner (the app lifespan) must call close_shared_session() when done.
+    Because the connector is shared, limit_per_host caps concurrent requests
+    to one host across all jobs. Scrapers used without an installed session
+    open and close their own.
+    """
+    global _SHARED_SESSION, _SHARED_SESSION_LOOP
+    session = _installed_session()
+    if session is not None:
+        return session
+    # Don't leave a session bound to an earlier loop open behind us.
+    await close_shared_session()
+    _SHARED_SESSION = _new_session()
+    _SHARED_SESSION_LOOP = asyncio.get_running_loop()
+    return _SHARED_SESSION
+
+
+async def close_shared_session():
+    """Close the shared aiohttp session, if one is open."""
+    global _SHARED_SESSION, _SHARED_SESSION_LOOP
+    session = _SHARED_SESSION
+    _SHARED_SESSION = None
+    _SHARED_SESSION_LOOP = None
+    if session is not None and not session.closed:
+        await session.close()
+
 
 class ScraperError(Exception):
     """Base exception for scraper errors."""
@@ -25,88 +128,115 @@ class Scraper:
     """Enhanced web scraper with improved metadata handling, markdown processing, smart wait/actions, JS rendering, and proxy support."""
 
     def __init__(self):
-        self._session = None
-        self._session_kwargs = {}
-        self.ua = UserAgent()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._playwright = None
+        self._browser = None
+        self._browser_lock = asyncio.Lock()
+        self.ua = _UA
+        self.user_agent = self.ua.random
         self.default_headers = {
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
         }
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Create or reuse aiohttp session with random user agent."""
-        if self._session is None:
-            headers = {**self.default_headers, "User-Agent": self.ua.random}
-            self._session = aiohttp.ClientSession(
-                headers=headers, **self._session_kwargs
-            )
+        """Return the shared session if one is installed, else this Scraper's own."""
+        session = _installed_session()
+        if session is not None:
+            return session
+        if self._session is None or self._session.closed:
+            self._session = _new_session()
         return self._session
 
+    async def _get_browser(self) -> Browser:
+        """Launch Chromium on first use and reuse it for later browser fetches."""
+        async with self._browser_lock:
+            if self._browser is None:
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+        return self._browser
+
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Cleanup resources."""
-        if self._session:
+        if self._session is not None:
             await self._session.close()
             self._session = None
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
 
     def _clean_markdown(self, markdown: str) -> str:
         """Enhanced markdown clearning for LLM-ready output."""
-        # Remove extra whitespace and normalize line endings
-        markdown = re.sub(r"\r\n?", "\n", markdown)
-        markdown = re.sub(r"[ \t]+$", "", markdown, flags=re.MULTILINE)
+        # Normalize line endings and drop trailing whitespace. Only \r and
+        # \r\n count as line breaks here, which rules out str.splitlines().
+        markdown = markdown.replace("\r\n", "\n").replace("\r", "\n")
+        markdown = "\n".join(line.rstrip(" \t") for line in markdown.split("\n"))
 
         # Fix headers
-        markdown = re.sub(
-            r"^(#+)\s*(.+?)[\s#]*$", r"\1 \2", markdown, flags=re.MULTILINE
-        )
+        markdown = _RE_HEADER.sub(r"\1 \2", markdown)
 
         # Fix quotes
-        markdown = re.sub(r'^"(.+?)"$', r"> \1", markdown, flags=re.MULTILINE)
-        markdown = re.sub(r"^by\s+(.+?)\s*$", r"By \1", markdown, flags=re.MULTILINE)
+        markdown = _RE_QUOTE.sub(r"> \1", markdown)
+        markdown = _RE_BYLINE.sub(r"By \1", markdown)
 
         # Fix lists
-        markdown = re.sub(r"^\s*[-*+]\s*(.+)$", r"- \1", markdown, flags=re.MULTILINE)
+        markdown = _RE_LIST_ITEM.sub(r"- \1", markdown)
 
         # Fix links
-        markdown = re.sub(
-            r"\[(.*?)\]\(([^)]+)\)",
+        markdown = _RE_LINK.sub(
             lambda m: f"[{m.group(1).strip()}]({m.group(2).strip()})",
             markdown,
         )
 
-        # Fix spacing around sections
-        sections = markdown.split("\n\n")
+        # Fix spacing around sections in a single pass over the lines.
+        # Sections are separated by empty lines; in sections containing a
+        # quote, "By ..." attributions are pushed into their own paragraph.
         cleaned_sections = []
-        for section in sections:
-            if section.strip():
-                lines = [line.strip() for line in section.split("\n") if line.strip()]
-
-                # Special handling for quotes and attributions
-                if any(line.startswith(">") for line in lines):
-                    quote_lines = []
-                    for line in lines:
-                        if line.startswith(">"):
-                            quote_lines.append(line)
-                        elif line.startswith("By "):
-                            quote_lines.append("\n" + line)
-                        else:
-                            quote_lines.append(line)
-                    cleaned_sections.append("\n".join(quote_lines))
-                else:
-                    cleaned_sections.append("\n".join(lines))
+        current = []
+        in_quote_section = False
+        lines = markdown.split("\n")
+        lines.append("")
+        for line in lines:
+            if not line:
+                if current:
+                    if in_quote_section:
+                        current = [
+                            "\n" + line if line.startswith("By ") else line
+                            for line in current
+                        ]
+                    cleaned_sections.append("\n".join(current))
+                    current = []
+                    in_quote_section = False
+                continue
+
+            line = line.strip()
+            if line:
+                current.append(line)
+                if line[0] == ">":
+                    in_quote_section = True
 
         # Join cleaned sections with double newlines
         markdown = "\n\n".join(cleaned_sections)
 
         # Final cleanup
-        markdown = re.sub(r"\n{3,}", "\n\n", markdown)
+        markdown = _RE_BLANK_LINES.sub("\n\n", markdown)
         markdown = markdown.strip()
 
         return markdown
 
     def _extract_metadata(
-        self, soup: BeautifulSoup, url: str, final_url: str, status: int
+        self,
+        soup: Tag,
+        url: str,
+        final_url: str,
+        status: int,
+        retrieved_at: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Comprehensive metadata extraction with improve URL handling."""
         metadata = {
@@ -123,89 +253,137 @@ class Scraper:
             "schema_org": {},
             "page_type": "unknown",
             "content_type": "text/html",
-            "retrieved_at": datetime.now(timezone.utc).isoformat(),
+            "retrieved_at": retrieved_at or _now_iso(),
         }
 
         try:
-            base_tag = soup.find("base", href=True)
+            base_tag = title_tag = html_tag = canonical = None
+            description_tag = keywords_meta = viewport_meta = None
+            ld_json_scripts = []
+
+            # Walk the tree once and dispatch on the tag name instead of
+            # running a separate search per metadata field.
+            for tag in soup.find_all(
+                ["meta", "link", "script", "title", "html", "base"]
+            ):
+                tag_name = tag.name
+                if tag_name == "meta":
+                    name = tag.get("name", "").lower()
+                    prop = tag.get("property", "").lower()
+                    if name == "description":
+                        if description_tag is None:
+                            description_tag = tag
+                    elif name == "keywords":
+                        if keywords_meta is None:
+                            keywords_meta = tag
+                    elif name == "viewport":
+                        if viewport_meta is None:
+                            viewport_meta = tag
+                    elif name.startswith("twitter:"):
+                        metadata["twitter_data"][name[8:]] = tag.get(
+                            "content", ""
+                        ).strip()
+                    if prop.startswith("og:"):
+                        key = prop[3:]
+                        metadata["og_data"][key] = tag.get("content", "").strip()
+                        if key == "type":
+                            metadata["page_type"] = tag.get("content", "").strip()
+                elif tag_name == "link":
+                    if canonical is None and "canonical" in (tag.get("rel") or ()):
+                        canonical = tag
+                elif tag_name == "script":
+                    if (
+                        tag.get("type") == "application/ld+json"
+                        and len(ld_json_scripts) < _MAX_LD_JSON_SCRIPTS
+                    ):
+                        ld_json_scripts.append(tag)
+                elif tag_name == "title":
+                    if title_tag is None:
+                        title_tag = tag
+                elif tag_name == "html":
+                    if html_tag is None:
+                        html_tag = tag
+                elif base_tag is None and tag.get("href"):
+                    base_tag = tag
+
             base_url = urljoin(final_url, base_tag["href"]) if base_tag else final_url
 
-            title_tag = soup.find("title")
             metadata["title"] = title_tag.get_text(strip=True) if title_tag else ""
-
-            html_tag = soup.find("html")
             metadata["language"] = (
                 html_tag.get("lang", "").lower()[:5] if html_tag else ""
             )
-
-            description_tag = soup.find(
-                "meta", attrs={"name": re.compile(r"description", re.I)}
-            )
             metadata["description"] = (
                 description_tag.get("content", "").strip() if description_tag else ""
             )
-
-            keywords_meta = soup.find(
-                "meta", attrs={"name": re.compile(r"keywords", re.I)}
-            )
             if keywords_meta:
                 metadata["keywords"] = keywords_meta.get("content", "").strip()
-
-            viewport_meta = soup.find(
-                "meta", attrs={"name": re.compile(r"viewport", re.I)}
-            )
             if viewport_meta:
                 metadata["viewport"] = viewport_meta.get("content", "").strip()
-
-            canonical = soup.find("link", rel="canonical")
             if canonical and canonical.get("href"):
                 metadata["cannonical"] = urljoin(base_url, canonical["href"])
 
-            open_graph_props = soup.find_all("meta", property=re.compile(r"og:", re.I))
-            for prop in open_graph_props:
-                key = prop["property"][3:].lower()
-                metadata["og_data"][key] = prop.get("content", "").strip()
-                if key == "type":
-                    metadata["page_type"] = prop.get("content", "").strip()
-
-            twitter_meta = soup.find_all(
-                "meta", attrs={"name": re.compile(r"twitter:", re.I)}
-            )
-            for meta in twitter_meta:
-                key = meta["name"][8:].lower()
-                metadata["twitter_data"][key] = meta.get("content", "").strip()
-
-            for script in soup.find_all("script", type="application/ld+json"):
+            for script in ld_json_scripts:
+                raw = script.string or "".join(script.strings)
                 try:
-                    data = json.loads(script.string)
+                    # orjson rejects str subclasses such as bs4's Script.
+                    data = orjson.loads(str(raw))
                     if isinstance(data, dict):
                         metadata["schema_org"] = data
                         break
                     elif isinstance(data, list) and len(data) > 0:
                         metadata["schema_org"] = data[0]
                         break
-                except (json.JSONDecodeError, TypeError, AttributeError):
+                except (orjson.JSONDecodeError, TypeError):
                     continue
         except Exception as e:
             logger.error(f"Error extracting metadata: {e}")
 
         return metadata
 
+    @staticmethod
+    async def _read_body(
+        response: aiohttp.ClientResponse, max_body_bytes: int
+    ) -> bytes:
+        """Read a response body, failing once it grows past max_body_bytes."""
+        # Hand the raw bytes to the parser so it can honour the HTTP/meta
+        # charset itself instead of decoding here.
+        buf = bytearray()
+        async for chunk in response.content.iter_chunked(65536):
+            buf.extend(chunk)
+            if len(buf) > max_body_bytes:
+                raise ScraperError(f"Response body exceeds {max_body_bytes} bytes")
+        return bytes(buf)
+
     async def _fetch_url(
-        self, url: str, max_retries: int = 3, proxy: Optional[str] = None
-    ) -> tuple[str, str, int]:
+        self,
+        url: str,
+        max_retries: int = 3,
+        proxy: Optional[str] = None,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+    ) -> tuple[bytes, str, int, Optional[str]]:
         """Fetch URL with retry logic and proper redirect handling using aiohttp."""
         session = await self._get_session()
         for attempt in range(max_retries):
             try:
                 async with session.get(
                     url,
+                    headers={**self.default_headers, "User-Agent": self.user_agent},
                     allow_redirects=True,
                     proxy=proxy,
-                    timeout=aiohttp.ClientTimeout(total=30),
+                    timeout=_REQUEST_TIMEOUT,
                 ) as response:
-                    content = await response.text()
-                    return content, str(response.url), response.status
+                    if (
+                        response.content_length is not None
+                        and response.content_length > max_body_bytes
+                    ):
+                        raise ScraperError(
+                            f"Response body exceeds {max_body_bytes} bytes"
+                        )
+                    content = await asyncio.wait_for(
+                        self._read_body(response, max_body_bytes),
+                        timeout=_BODY_READ_DEADLINE,
+                    )
+                    return content, str(response.url), response.status, response.charset
             except (aiohttp.ClientConnectionError, aiohttp.ServerTimeoutError) as e:
                 if attempt == max_retries - 1:
                     raise ScraperError(
@@ -214,23 +392,50 @@ class Scraper:
                 await asyncio.sleep(2**attempt)  # Exponential backoff
             except aiohttp.ClientError as e:
                 raise ScraperError(f"Client error: {str(e)}")
+            except asyncio.TimeoutError:
+                # The total budget or the body deadline ran out. Socket timeouts
+                # are ServerTimeoutErrors and were retried above.
+                raise ScraperError(f"Timed out fetching {url}")
         raise ScraperError(f"Failed to fetch {url} after {max_retries} attempts")
 
     async def _fetch_url_browser(
         self, url: str, page_options: Dict
-    ) -> tuple[str, str, int]:
+    ) -> tuple[bytes, str, int, Optional[str]]:
         """
         Fetch URL using Playwright for JavaScript rendering, smart wait, and actions.
         Expects page_options to potentially include:
+            - 'wait_for_selector': CSS selector to wait for after page load
+            - 'wait_for_load_state': 'load', 'domcontentloaded' or 'networkidle'
+            - 'wait_timeout': milliseconds before giving up on the waits above
             - 'wait_for': miliseconds to wait after page load
             - 'actions': list of actions (dicts) with types: wait, click, scroll, write, press
         """
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(user_agent=self.ua.random)
+        wait_for_selector = page_options.get("wait_for_selector")
+        wait_for_load_state = page_options.get("wait_for_load_state")
+        if wait_for_load_state and wait_for_load_state not in _LOAD_STATES:
+            raise ScraperError(f"Invalid wait_for_load_state: {wait_for_load_state}")
+        # Playwright treats a timeout of 0 as "wait forever".
+        wait_timeout = page_options.get("wait_timeout") or DEFAULT_BROWSER_WAIT_TIMEOUT
+
+        browser = await self._get_browser()
+        context = await browser.new_context(user_agent=self.user_agent)
+        try:
             page = await context.new_page()
             await page.goto(url, wait_until="domcontentloaded")
 
+            # Wait for the page to be ready rather than sleeping blindly.
+            try:
+                if wait_for_selector:
+                    await page.wait_for_selector(
+                        wait_for_selector, timeout=wait_timeout
+                    )
+                if wait_for_load_state:
+                    await page.wait_for_load_state(
+                        wait_for_load_state, timeout=wait_timeout
+                    )
+            except PlaywrightTimeoutError:
+                logger.debug(f"Timed out waiting for {url}, using current page")
+
             if page_options.get("wait_for"):
                 await page.wait_for_timeout(page_options["wait_for"])
 
@@ -256,38 +461,41 @@ class Scraper:
                     key = action.get("key")
                     if key:
                         await page.keyboard.press(key)
-        if page_options.get("post_action_wait"):
-            await page.wait_for_timeout(page_options["post_action_wait"])
 
-        content = await page.content()
-        final_url = page.url
+            if page_options.get("post_action_wait"):
+                await page.wait_for_timeout(page_options["post_action_wait"])
+
+            content = await page.content()
+            final_url = page.url
+        finally:
+            await context.close()
+
         status = 200
-        await browser.close()
-        return content, final_url, status
+        return content.encode("utf-8"), final_url, status, "utf-8"
 
     def _generate_formats(
-        self, soup: BeautifulSoup, formats: List[str], page_options: Dict
+        self, soup: Tag, formats: List[str], page_options: Dict
     ) -> Dict[str, Any]:
         """Generate content in requested formats with improved HTML processing."""
         result = {}
-        processed_html = str(soup)
+        if page_options.get("skip_content"):
+            return result
 
         if "markdown" in formats:
-            markdown = markdownify.markdownify(
-                processed_html,
-                heading_style="ATX",
-                bullets=["•", "◦", "▪"],
-                default_title=False,
-            )
+            # Convert the existing tree rather than re-parsing serialized HTML.
+            # Only documents get their edge newlines stripped by markdownify,
+            # so strip them here for main-content subtrees too.
+            markdown = _MARKDOWN_CONVERTER.convert_soup(soup).strip("\n")
             if page_options.get("clean_markdown", True):
                 markdown = self._clean_markdown(markdown)
             result["markdown"] = markdown
         if "html" in formats:
-            result["html"] = processed_html
+            # Serialize only when HTML output was asked for.
+            result["html"] = str(soup)
 
         if "text" in formats:
             text = soup.get_text(separator="\n", strip=True)
-            text = re.sub(r"\n{3,}", "\n\n", text)
+            text = _RE_BLANK_LINES.sub("\n\n", text)
             result["text"] = text.strip()
 
         return result
@@ -296,8 +504,10 @@ class Scraper:
         self, url: str, formats: List[str] = None, page_options: Dict = None
     ) -> Dict[str, Any]:
         """Enhanced scraping method with improved content selection, JS rendering, and structured JSON output."""
-        formats = formats or ["markdown"]
+        # An explicit empty list means metadata and links only.
+        formats = ["markdown"] if formats is None else formats
         page_options = page_options or {}
+        retrieved_at = _now_iso()
         result = {
             "error": None,
             "metadata": {
@@ -306,7 +516,7 @@ class Scraper:
                 "language": "",
                 "source_url": url,
                 "status": None,
-                "retrieved_at": datetime.now(timezone.utc).isoformat(),
+                "retrieved_at": retrieved_at,
             },
             "content": {},
             "links": [],
@@ -322,13 +532,20 @@ class Scraper:
             try:
                 if use_browser:
                     logger.debug("Starting browser fetch")
-                    content, final_url, status = await self._fetch_url_browser(
-                        url, page_options
-                    )
+                    (
+                        content,
+                        final_url,
+                        status,
+                        encoding,
+                    ) = await self._fetch_url_browser(url, page_options)
                 else:
                     logger.debug("Starting direct fetch")
-                    content, final_url, status = await self._fetch_url(
-                        url, max_retries=page_options.get("max_retries", 3), proxy=proxy
+                    content, final_url, status, encoding = await self._fetch_url(
+                        url,
+                        max_retries=page_options.get("max_retries", 3),
+                        proxy=proxy,
+                        max_body_bytes=page_options.get("max_body_bytes")
+                        or DEFAULT_MAX_BODY_BYTES,
                     )
 
                 result["metadata"]["status"] = status
@@ -337,42 +554,57 @@ class Scraper:
                 if not content:
                     raise ScraperError("No content retrieved from the URL.")
 
-                soup = BeautifulSoup(content, "lxml")
+                soup = BeautifulSoup(content, "lxml", from_encoding=encoding)
 
-                for tag in page_options.get(
+                # Collect every excluded tag in one traversal. Matches nested
+                # inside an already removed element are skipped.
+                exclude_tags = page_options.get(
                     "exclude_tags", ["script", "style", "noscript"]
-                ):
-                    for element in soup.find_all(tag):
-                        element.decompose()
+                )
+                if exclude_tags:
+                    for element in soup.find_all(exclude_tags):
+                        if not element.decomposed:
+                            element.decompose()
 
                 if page_options.get("extract_main_content"):
                     css_selector = page_options.get(
                         "main_content_selector", "main, article, .main-content"
                     )
-                    main_content = soup.select_one(css_selector)
+                    # Work on the matched subtree in place instead of
+                    # serializing and re-parsing it.
+                    selector = _compile_selector(css_selector)
+                    main_content = selector.select_one(soup) or soup.find("body")
                     if main_content:
-                        soup = BeautifulSoup(main_content, "lxml")
-                    else:
-                        body = soup.find("body")
-                        if body:
-                            soup = BeautifulSoup(str(body), "lxml")
+                        soup = main_content
 
-                metadata = self._extract_metadata(soup, url, final_url, status)
+                metadata = self._extract_metadata(
+                    soup, url, final_url, status, retrieved_at
+                )
                 result["metadata"].update(metadata)
 
                 content_formats = self._generate_formats(soup, formats, page_options)
-                if not content_formats:
+                if (
+                    not content_formats
+                    and formats
+                    and not page_options.get("skip_content")
+                ):
                     raise ScraperError("Failed to generate content formats")
                 result["content"] = content_formats
 
                 if page_options.get("include_links"):
+                    # Pages repeat the same hrefs a lot, so join each one once.
+                    joined_urls: Dict[str, str] = {}
+                    links = result["links"]
                     for link in soup.find_all("a", href=True):
-                        absolute_url = urljoin(final_url, link["href"])
-                        result["links"].append(
+                        href = link["href"]
+                        absolute_url = joined_urls.get(href)
+                        if absolute_url is None:
+                            absolute_url = joined_urls[href] = urljoin(final_url, href)
+                        links.append(
                             {
                                 "text": link.get_text(strip=True),
                                 "url": absolute_url,
-                                "nofollow": "nofollow" in link.get("rel", []),
+                                "nofollow": "nofollow" in (link.get("rel") or ()),
                             }
                         )
 
@@ -400,7 +632,7 @@ class Scraper:
             result["metadata"] = {
                 "source_url": url,
                 "status": "failed",
-                "retrieved_at": datetime.now(timezone.utc).isoformat(),
+                "retrieved_at": retrieved_at,
             }
             return result
 
@@ -412,15 +644,39 @@ class Scraper:
         concurrency: int = 5,
     ) -> Dict[str, dict]:
         """Batch scraping with improved concurrency control."""
+        if not isinstance(concurrency, int) or concurrency < 1:
+            raise ValueError("concurrency must be a positive integer")
+
         results = {}
-        semaphore = asyncio.Semaphore(concurrency)
+        if not urls:
+            return results
 
-        async def _scrape_with_semaphore(url):
-            async with semaphore:
-                return await self.scrape(url, formats, page_options)
+        batch_results: List[Any] = [None] * len(urls)
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in enumerate(urls):
+            queue.put_nowait(item)
 
-        tasks = [_scrape_with_semaphore(url) for url in urls]
-        batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def _worker():
+            while True:
+                index, url = await queue.get()
+                try:
+                    batch_results[index] = await self.scrape(url, formats, page_options)
+                except Exception as e:
+                    batch_results[index] = e
+                finally:
+                    queue.task_done()
+
+        # A fixed pool of workers drains the queue, so only `concurrency`
+        # scrapes are alive at any time regardless of the batch size.
+        workers = [
+            asyncio.create_task(_worker()) for _ in range(min(concurrency, len(urls)))
+        ]
+        try:
+            await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
         for url, result in zip(urls, batch_results):
             if isinstance(result, Exception):
@@ -1,7 +1,18 @@
+from contextlib import asynccontextmanager
+
 from fastapi import APIRouter, FastAPI
 
+from src.core.scraper import close_shared_session, open_shared_session
 from src.routes import crawl, history, jobs, map, scrape
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await open_shared_session()
+    yield
+    await close_shared_session()
+
+
 app = FastAPI(
     title="Scraper API",
     description="""
@@ -17,6 +28,7 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    lifespan=lifespan,
 )
 
 api_router = APIRouter(prefix="/api")
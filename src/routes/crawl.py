@@ -1,11 +1,11 @@
 from typing import List, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl
 from sqlalchemy.orm import Session
 
 from src.core.crawler import Crawler
-from src.core.database import get_db
+from src.core.database import get_db, get_db_session
 from src.core.job_manager import JobManager
 
 router = APIRouter()
@@ -23,6 +23,7 @@ class PageOptions(BaseModel):
 class CrawlOptions(BaseModel):
     max_depth: Optional[int] = None
     max_pages: Optional[int] = None
+    concurrency: int = Field(20, ge=1)
     formats: List[str] = ["markdown"]
     exclude_paths: List[str] = []
     include_only_paths: List[str] = []
@@ -41,29 +42,29 @@ class CrawlRequest(BaseModel):
 
 
 async def background_crawl(job_id: str, url: str, options: dict):
-    db = next(get_db())
-    try:
-        async with Crawler() as crawler:
-            result = await crawler.crawl(url=url, options=options)
-
-            normalize_result = {
-                "metadata_content": {
-                    "total_pages": result["metadata"]["total_pages"],
-                    "depth_reached": result["metadata"]["depth_reached"],
-                    "start_time": result["metadata"]["start_time"],
-                    "end_time": result["metadata"]["end_time"],
-                    "options": result["metadata"]["options"],
-                },
-                "content": {
-                    "pages": result["pages"],
-                },
-            }
-
-            job_manager.update_job(db, job_id, "completed", result=normalize_result)
-    except Exception as e:
-        error_msg = f"Crawling failed: {str(e)}"
-        print(error_msg)
-        job_manager.update_job(db, job_id, "failed", error=error_msg)
+    with get_db_session() as db:
+        try:
+            async with Crawler() as crawler:
+                result = await crawler.crawl(url=url, options=options)
+
+                normalize_result = {
+                    "metadata_content": {
+                        "total_pages": result["metadata"]["total_pages"],
+                        "depth_reached": result["metadata"]["depth_reached"],
+                        "start_time": result["metadata"]["start_time"],
+                        "end_time": result["metadata"]["end_time"],
+                        "options": result["metadata"]["options"],
+                    },
+                    "content": {
+                        "pages": result["pages"],
+                    },
+                }
+
+                job_manager.update_job(db, job_id, "completed", result=normalize_result)
+        except Exception as e:
+            error_msg = f"Crawling failed: {str(e)}"
+            print(error_msg)
+            job_manager.update_job(db, job_id, "failed", error=error_msg)
 
 
 @router.post("/async")
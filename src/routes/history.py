@@ -53,7 +53,7 @@ async def get_history(
 
 @router.get("/{job_id}/content")
 async def get_job_content(job_id: str, db: Session = Depends(get_db)):
-    content = db.query(ScrapedContent).filter(ScrapedContent.job_id == job_id).first()
+    content = db.get(ScrapedContent, job_id)
 
     if not content:
         raise HTTPException(status_code=404, detail="Content not found")
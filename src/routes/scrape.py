@@ -1,16 +1,18 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends
 from pydantic import BaseModel, HttpUrl
 from sqlalchemy.orm import Session
 
-from src.core.database import get_db
+from src.core.database import get_db, get_db_session
 from src.core.job_manager import JobManager
 from src.core.scraper import Scraper
 
 router = APIRouter()
 job_manager = JobManager()
 
+LoadState = Literal["load", "domcontentloaded", "networkidle"]
+
 
 class PageOptions(BaseModel):
     extract_main_content: bool = True
@@ -18,9 +20,15 @@ class PageOptions(BaseModel):
     structured_json: bool = False
     use_browser: bool = False
     wait_for: Optional[int] = None
+    wait_for_selector: Optional[str] = None
+    wait_for_load_state: Optional[LoadState] = None
+    wait_timeout: Optional[int] = None
     actions: Optional[List[Dict[str, Any]]] = None
     max_retries: Optional[int] = 3
     proxy: Optional[str] = None
+    max_body_bytes: Optional[int] = None
+    clean_markdown: bool = True
+    skip_content: bool = False
 
 
 class ScrapeRequest(BaseModel):
@@ -38,45 +46,45 @@ class BatchScrapeRequest(BaseModel):
 async def background_scrape(
     job_id: str, url: str, formats: List[str], page_options: Dict
 ):
-    db = next(get_db())
-    try:
-        async with Scraper() as scraper:
-            result = await scraper.scrape(
-                url=url, formats=formats, page_options=page_options
-            )
-
-            if result is None:
-                result = {
-                    "error": "Scraping returned no results",
-                    "metadata": {},
-                    "content": {},
-                }
-
-            if not isinstance(result, dict):
-                result = {
-                    "error": "Invalid result format",
-                    "metadata": {},
-                    "content": str(result),
+    with get_db_session() as db:
+        try:
+            async with Scraper() as scraper:
+                result = await scraper.scrape(
+                    url=url, formats=formats, page_options=page_options
+                )
+
+                if result is None:
+                    result = {
+                        "error": "Scraping returned no results",
+                        "metadata": {},
+                        "content": {},
+                    }
+
+                if not isinstance(result, dict):
+                    result = {
+                        "error": "Invalid result format",
+                        "metadata": {},
+                        "content": str(result),
+                    }
+
+                normalized_result = {
+                    "metadata": result.get("metadata", {}),
+                    "content": {
+                        format_type: content
+                        for format_type, content in result.get("content", {}).items()
+                    },
                 }
 
-            normalized_result = {
-                "metadata": result.get("metadata", {}),
-                "content": {
-                    format_type: content
-                    for format_type, content in result.get("content", {}).items()
-                },
-            }
+                if result.get("error"):
+                    normalized_result["metadata_content"]["error"] = result["error"]
 
-            if result.get("error"):
-                normalized_result["metadata_content"]["error"] = result["error"]
-
-            job_manager.update_job(db, job_id, "completed", result=normalized_result)
-    except Exception as e:
-        error_msg = f"Scraping failed: {str(e)}"
-        print(error_msg)
-        job_manager.update_job(db, job_id, "failed", error=error_msg)
-    finally:
-        db.close()
+                job_manager.update_job(
+                    db, job_id, "completed", result=normalized_result
+                )
+        except Exception as e:
+            error_msg = f"Scraping failed: {str(e)}"
+            print(error_msg)
+            job_manager.update_job(db, job_id, "failed", error=error_msg)
 
 
 @router.post("/async")
@@ -127,17 +135,15 @@ async def start_batch_scrape(
     Return a list of job IDs that can be used to check status
     and retrieve results.
     """
-    job_ids = []
-    for url in request.urls:
-        job_id = job_manager.create_job(
-            db,
-            url=str(url),
-            operation="scrape_batch",
-            formats=request.formats,
-            page_options=request.page_options.model_dump(exclude_none=True),
-        )
+    job_ids = job_manager.create_jobs(
+        db,
+        urls=[str(url) for url in request.urls],
+        operation="scrape_batch",
+        formats=request.formats,
+        page_options=request.page_options.model_dump(exclude_none=True),
+    )
 
-        job_ids.append(job_id)
+    for job_id, url in zip(job_ids, request.urls):
         background_tasks.add_task(
             background_scrape,
             job_id,
@@ -52,3 +52,12 @@ def test_history():
         assert "operation" in job
         assert "status" in job
         assert "url" in job
+
+
+def test_crawl_rejects_non_positive_concurrency():
+    """Test that a crawl with no workers is rejected before a job is created."""
+    response = client.post(
+        "/api/crawl/async",
+        json={"url": "https://example.com/", "options": {"concurrency": 0}},
+    )
+    assert response.status_code == 422
@@ -0,0 +1,109 @@
+import asyncio
+from collections import Counter
+from urllib.parse import urlsplit
+
+from src.core.crawler import Crawler
+from src.core.scraper import Scraper
+
+BASE_PARSED = urlsplit("https://example.com/")
+
+
+def test_should_crawl_exclude_paths():
+    """Test exact and wildcard exclude patterns."""
+    crawler = Crawler()
+    options = {"exclude_paths": ["/private/*", "/login"]}
+    assert crawler._should_crawl("https://example.com/blog/post", BASE_PARSED, options)
+    assert not crawler._should_crawl(
+        "https://example.com/private/data", BASE_PARSED, options
+    )
+    assert not crawler._should_crawl("https://example.com/login/", BASE_PARSED, options)
+    assert crawler._should_crawl("https://example.com/login/help", BASE_PARSED, options)
+
+
+def test_should_crawl_include_only_paths():
+    """Test that only matching paths are crawled when includes are set."""
+    crawler = Crawler()
+    options = {"include_only_paths": ["/docs/*", "/about"]}
+    assert crawler._should_crawl("https://example.com/docs/intro", BASE_PARSED, options)
+    assert crawler._should_crawl("https://example.com/about", BASE_PARSED, options)
+    assert not crawler._should_crawl("https://example.com/blog", BASE_PARSED, options)
+
+
+def test_should_crawl_rejects_other_domains_and_assets():
+    """Test the domain check and the built-in static asset filter."""
+    crawler = Crawler()
+    assert not crawler._should_crawl("https://other.com/page", BASE_PARSED, {})
+    assert not crawler._should_crawl(
+        "https://example.com/static/app.js", BASE_PARSED, {}
+    )
+    assert not crawler._should_crawl("ftp://example.com/file", BASE_PARSED, {})
+
+
+SITE = {
+    "https://example.com": ["/a", "/b", "/shared", "/broken"],
+    "https://example.com/a": ["/a/1", "/shared"],
+    "https://example.com/b": ["/shared", "/a"],
+    "https://example.com/a/1": ["/shared"],
+    "https://example.com/shared": ["/a"],
+}
+
+
+def _crawl(monkeypatch, options):
+    """Crawl SITE with a stubbed Scraper.scrape, returning results and call counts."""
+    calls = Counter()
+
+    async def fake_scrape(self, url, formats=None, page_options=None):
+        calls[url] += 1
+        await asyncio.sleep(0)
+        if url.endswith("/broken"):
+            raise RuntimeError("boom")
+        return {
+            "error": None,
+            "content": {"markdown": url},
+            "metadata": {},
+            "links": [{"url": link} for link in SITE[url]],
+        }
+
+    monkeypatch.setattr(Scraper, "scrape", fake_scrape)
+
+    async def run():
+        async with Crawler() as crawler:
+            return await crawler.crawl("https://example.com/", options)
+
+    return asyncio.run(run()), calls
+
+
+def test_crawl_visits_each_page_once(monkeypatch):
+    """Test a full crawl, including pages linked from many others and errors."""
+    results, calls = _crawl(monkeypatch, {})
+    assert set(results["pages"]) == set(SITE) | {"https://example.com/broken"}
+    assert set(calls.values()) == {1}
+    assert results["pages"]["https://example.com/broken"]["error"] == "boom"
+    assert results["metadata"]["total_pages"] == 6
+    assert results["metadata"]["depth_reached"] == 2
+
+
+def test_crawl_max_depth(monkeypatch):
+    """Test that max_depth counts the start page as depth 0."""
+    results, calls = _crawl(monkeypatch, {"max_depth": 0})
+    assert results["pages"] == {}
+    assert not calls
+    assert results["metadata"]["total_pages"] == 0
+    assert results["metadata"]["depth_reached"] == -1
+
+    results, _ = _crawl(monkeypatch, {"max_depth": 1})
+    assert list(results["pages"]) == ["https://example.com"]
+    assert results["metadata"]["depth_reached"] == 0
+
+    results, _ = _crawl(monkeypatch, {"max_depth": 2})
+    assert "https://example.com/a/1" not in results["pages"]
+    assert results["metadata"]["total_pages"] == 5
+    assert results["metadata"]["depth_reached"] == 1
+
+
+def test_crawl_max_pages(monkeypatch):
+    """Test that no more than max_pages pages are scraped."""
+    results, calls = _crawl(monkeypatch, {"max_pages": 3, "concurrency": 4})
+    assert sum(calls.values()) == 3
+    assert len(results["pages"]) == 3
+    assert results["metadata"]["total_pages"] == 3
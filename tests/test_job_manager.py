@@ -0,0 +1,52 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.core.database import Base, Job
+from src.core.job_manager import JobManager
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+def test_update_job_batch_commits_together(session_factory):
+    """Test that queued updates are only persisted by commit_pending."""
+    job_manager = JobManager()
+    with session_factory() as db:
+        job_ids = job_manager.create_jobs(db, ["https://a.com", "https://b.com"])
+        job_manager.update_job(
+            db, job_ids[0], "completed", result={"content": {"text": "a"}}, commit=False
+        )
+        job_manager.update_job(db, job_ids[1], "failed", error="boom", commit=False)
+
+        with session_factory() as other:
+            assert {job.status for job in other.query(Job)} == {"pending"}
+
+        job_manager.commit_pending(db)
+
+    with session_factory() as db:
+        assert db.get(Job, job_ids[0]).status == "completed"
+        assert db.get(Job, job_ids[1]).status == "failed"
+        status = job_manager.get_job_status(db, job_ids[0])
+        assert status["result"]["content"] == {"text": "a"}
+
+
+def test_failed_batched_update_keeps_earlier_updates(session_factory):
+    """Test that a failing update does not roll back updates queued before it."""
+    job_manager = JobManager()
+    with session_factory() as db:
+        job_ids = job_manager.create_jobs(db, ["https://a.com", "https://b.com"])
+        job_manager.update_job(db, job_ids[0], "failed", error="boom", commit=False)
+        with pytest.raises(AttributeError):
+            job_manager.update_job(
+                db, job_ids[1], "completed", result=["not", "a", "dict"], commit=False
+            )
+        job_manager.commit_pending(db)
+
+    with session_factory() as db:
+        assert db.get(Job, job_ids[0]).status == "failed"
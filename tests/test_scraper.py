@@ -0,0 +1,211 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from bs4 import BeautifulSoup
+
+from src.core import scraper as scraper_module
+from src.core.scraper import (
+    Scraper,
+    ScraperError,
+    close_shared_session,
+    open_shared_session,
+)
+
+
+def test_clean_markdown_sections():
+    """Test header, list and blank-line cleanup."""
+    markdown = "#  Title ##\r\nSome text   \n* one\n+ two\n\n\n\n[ link ]( /a )"
+    assert Scraper()._clean_markdown(markdown) == (
+        "# Title\nSome text\n- one\n- two\n\n[link](/a)"
+    )
+
+
+def test_clean_markdown_quote_attribution():
+    """Test that attributions inside quote sections get their own paragraph."""
+    markdown = '"To be or not"\nby Shakespeare\n\nBy itself'
+    assert Scraper()._clean_markdown(markdown) == (
+        "> To be or not\n\nBy Shakespeare\n\nBy itself"
+    )
+
+
+def test_extract_metadata():
+    """Test metadata extraction from head tags."""
+    html = (
+        '<html lang="en-US"><head><title> Page </title><base href="/sub/">'
+        '<meta name="twitter:description" content="tw">'
+        '<meta name="Description" content=" desc ">'
+        '<meta property="og:type" content="article">'
+        '<link rel="canonical" href="canon"></head><body></body></html>'
+    )
+    soup = BeautifulSoup(html, "lxml")
+    metadata = Scraper()._extract_metadata(
+        soup, "https://ex.com/a", "https://ex.com/a", 200
+    )
+    assert metadata["title"] == "Page"
+    assert metadata["language"] == "en-us"
+    assert metadata["description"] == "desc"
+    assert metadata["twitter_data"] == {"description": "tw"}
+    assert metadata["page_type"] == "article"
+    assert metadata["cannonical"] == "https://ex.com/sub/canon"
+
+
+def test_scrape_batch_keeps_order_and_wraps_errors():
+    """Test that batch results follow the input order and capture failures."""
+    scraper = Scraper()
+
+    async def fake_scrape(url, formats=None, page_options=None):
+        await asyncio.sleep(0.01 if url.endswith("a") else 0)
+        if url.endswith("bad"):
+            raise RuntimeError("boom")
+        return {"error": None, "metadata": {"source_url": url}}
+
+    scraper.scrape = fake_scrape
+    urls = ["https://ex.com/a", "https://ex.com/bad", "https://ex.com/c"]
+    results = asyncio.run(scraper.scrape_batch(urls, concurrency=2))
+    assert list(results) == urls
+    assert results["https://ex.com/bad"]["error"] == "boom"
+    assert results["https://ex.com/c"]["metadata"]["source_url"] == "https://ex.com/c"
+
+
+def test_scrape_without_formats_returns_metadata_only():
+    """Test that an empty format list skips content generation."""
+    scraper = Scraper()
+
+    async def fake_fetch(url, **kwargs):
+        html = b"<html><head><title>T</title></head><body><p>x</p></body></html>"
+        return html, url, 200, "utf-8"
+
+    scraper._fetch_url = fake_fetch
+    result = asyncio.run(scraper.scrape("https://ex.com/", formats=[]))
+    assert result["error"] is None
+    assert result["content"] == {}
+    assert result["metadata"]["title"] == "T"
+
+
+def test_extract_metadata_ld_json():
+    """Test that the first usable JSON-LD block is used."""
+    html = (
+        '<html><head><script type="application/ld+json"></script>'
+        '<script type="application/ld+json">not json</script>'
+        '<script type="application/ld+json">[{"@type": "Article"}]</script>'
+        '<script type="application/ld+json">{"@type": "Other"}</script>'
+        "</head></html>"
+    )
+    soup = BeautifulSoup(html, "lxml")
+    metadata = Scraper()._extract_metadata(
+        soup, "https://ex.com/", "https://ex.com/", 200
+    )
+    assert metadata["schema_org"] == {"@type": "Article"}
+
+
+def test_scraper_closes_its_own_session():
+    """Test that a Scraper outside the app lifespan closes the session it opened."""
+
+    async def run():
+        async with Scraper() as scraper:
+            return await scraper._get_session()
+
+    assert asyncio.run(run()).closed
+
+
+def test_scraper_uses_installed_shared_session():
+    """Test that an installed shared session is reused and left open."""
+
+    async def run():
+        shared = await open_shared_session()
+        try:
+            async with Scraper() as scraper:
+                assert await scraper._get_session() is shared
+            assert not shared.closed
+        finally:
+            await close_shared_session()
+        return shared
+
+    assert asyncio.run(run()).closed
+
+
+def test_open_shared_session_closes_session_from_previous_loop():
+    """Test that a shared session left on an old event loop is closed, not leaked."""
+    stale = asyncio.run(open_shared_session())
+
+    async def run():
+        try:
+            return await open_shared_session()
+        finally:
+            await close_shared_session()
+
+    fresh = asyncio.run(run())
+    assert stale.closed
+    assert fresh is not stale
+
+
+def test_browser_fetch_rejects_unknown_load_state():
+    """Test that a misspelled load state fails before a browser is launched."""
+    scraper = Scraper()
+
+    async def no_browser():
+        raise AssertionError("browser should not be launched")
+
+    scraper._get_browser = no_browser
+    result = asyncio.run(
+        scraper.scrape(
+            "https://ex.com/",
+            page_options={"use_browser": True, "wait_for_load_state": "idle"},
+        )
+    )
+    assert "Invalid wait_for_load_state: idle" in result["metadata"]["error"]
+
+
+def test_fetch_url_deadline_stops_trickling_body(monkeypatch):
+    """Test that a body sent a byte at a time can't hold a fetch past its deadline."""
+    monkeypatch.setattr(scraper_module, "_BODY_READ_DEADLINE", 0.5)
+
+    async def trickle(request):
+        response = web.StreamResponse()
+        await response.prepare(request)
+        for _ in range(200):
+            await response.write(b"x")
+            await asyncio.sleep(0.05)
+        return response
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/", trickle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        try:
+            async with Scraper() as scraper:
+                await scraper._fetch_url(f"http://127.0.0.1:{port}/")
+        finally:
+            await runner.cleanup()
+
+    start = time.monotonic()
+    with pytest.raises(ScraperError, match="Timed out"):
+        asyncio.run(run())
+    assert time.monotonic() - start < 5
+
+
+def test_browser_fetch_uses_scraper_user_agent():
+    """Test that the browser sends the same user agent as HTTP fetches."""
+    scraper = Scraper()
+    seen = []
+
+    class FakeBrowser:
+        async def new_context(self, user_agent):
+            seen.append(user_agent)
+            raise RuntimeError("stop")
+
+    async def fake_browser():
+        return FakeBrowser()
+
+    scraper._get_browser = fake_browser
+    for _ in range(2):
+        asyncio.run(
+            scraper.scrape("https://ex.com/", page_options={"use_browser": True})
+        )
+    assert seen == [scraper.user_agent, scraper.user_agent]